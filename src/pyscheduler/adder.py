@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from uuid import UUID, uuid4
 
 from pyscheduler.errors import InvalidConditionError, InvalidOperationError
@@ -27,20 +28,34 @@ class Adder:
         self._modifier = modifier
         self._operations = operations
         self._conditions = conditions
+        self._operation_types = set[str]()
+        self._condition_types = set[str]()
 
-    async def add(self, request: t.ScheduleRequest) -> t.PendingTask:
-        """Add a task."""
-        operation = await self._operations.create(request.operation.type)
+    async def _validate_operation(self, operation_type: str) -> None:
+        if operation_type in self._operation_types:
+            return
+
+        operation = await self._operations.create(operation_type)
         if operation is None:
-            raise InvalidOperationError(request.operation.type)
+            raise InvalidOperationError(operation_type)
+
+        self._operation_types.add(operation_type)
+
+    async def _validate_condition(self, condition_type: str) -> None:
+        if condition_type in self._condition_types:
+            return
 
-        condition = await self._conditions.create(request.condition.type)
+        condition = await self._conditions.create(condition_type)
         if condition is None:
-            raise InvalidConditionError(request.condition.type)
+            raise InvalidConditionError(condition_type)
 
-        task_id = uuid4()
+        self._condition_types.add(condition_type)
+
+    async def _build_task(self, request: t.ScheduleRequest) -> r.Task:
+        await self._validate_operation(request.operation.type)
+        await self._validate_condition(request.condition.type)
 
-        task = r.Task(
+        return r.Task(
             operation=r.Specification(
                 type=request.operation.type,
                 parameters=request.operation.parameters,
@@ -49,25 +64,37 @@ class Adder:
                 type=request.condition.type,
                 parameters=request.condition.parameters,
             ),
-            dependencies=request.dependencies,
+            dependencies=dict(request.dependencies),
         )
 
+    async def add(self, request: t.ScheduleRequest) -> t.PendingTask:
+        """Add a task."""
+        task = await self._build_task(request)
+        task_id = uuid4()
+
         async with self._lock:
             task = await self._modifier.add_pending_task(task_id, task, awareutcnow())
+
+        await self._queue.put(task_id)
+
+        return task.to_transfer(task_id)
+
+    async def add_many(
+        self, requests: Sequence[t.ScheduleRequest]
+    ) -> list[t.PendingTask]:
+        """Add multiple tasks."""
+        if not requests:
+            return []
+
+        tasks = [(uuid4(), await self._build_task(request)) for request in requests]
+
+        async with self._lock:
+            pending_tasks = await self._modifier.add_pending_tasks(tasks, awareutcnow())
+
+        for task_id, _ in tasks:
             await self._queue.put(task_id)
 
-        return t.PendingTask(
-            task=t.Task(
-                id=task_id,
-                operation=t.Specification(
-                    type=task.task.operation.type,
-                    parameters=task.task.operation.parameters,
-                ),
-                condition=t.Specification(
-                    type=task.task.condition.type,
-                    parameters=task.task.condition.parameters,
-                ),
-                dependencies=task.task.dependencies,
-            ),
-            scheduled=task.scheduled,
-        )
+        return [
+            task.to_transfer(task_id)
+            for (task_id, _), task in zip(tasks, pending_tasks, strict=True)
+        ]
@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import Sequence
+
 from pyscheduler.events import EventCache
 from pyscheduler.models import transfer as t
 from pyscheduler.modifier import Modifier
@@ -19,25 +22,34 @@ class Canceller:
 
         async with self._lock:
             task = await self._modifier.move_task_to_cancelled(task_id, awareutcnow())
-            cancelled = await self._cache.get(f"cancelled:{task_id}")
+            cancelled = await self._cache.get("cancelled", task_id)
             await cancelled.notify()
-            finished = await self._cache.get(f"finished:{task_id}")
+            finished = await self._cache.get("finished", task_id)
             await finished.notify()
 
-        return t.CancelledTask(
-            task=t.Task(
-                id=task_id,
-                operation=t.Specification(
-                    type=task.task.operation.type,
-                    parameters=task.task.operation.parameters,
-                ),
-                condition=t.Specification(
-                    type=task.task.condition.type,
-                    parameters=task.task.condition.parameters,
-                ),
-                dependencies=task.task.dependencies,
-            ),
-            scheduled=task.scheduled,
-            started=task.started,
-            cancelled=task.cancelled,
-        )
+        return task.to_transfer(task_id)
+
+    async def cancel_many(
+        self, requests: Sequence[t.CancelRequest]
+    ) -> list[t.CancelledTask]:
+        """Cancel multiple tasks."""
+        if not requests:
+            return []
+
+        task_ids = [request.id for request in requests]
+
+        async with self._lock:
+            tasks = await self._modifier.move_tasks_to_cancelled(
+                task_ids, awareutcnow()
+            )
+            events = [
+                await self._cache.get(kind, task_id)
+                for task_id in task_ids
+                for kind in ("cancelled", "finished")
+            ]
+            await asyncio.gather(*(event.notify() for event in events))
+
+        return [
+            task.to_transfer(task_id)
+            for task_id, task in zip(task_ids, tasks, strict=True)
+        ]
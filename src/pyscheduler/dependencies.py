@@ -1,25 +1,24 @@
-import asyncio
 from dataclasses import dataclass
 from typing import Literal
 from uuid import UUID
 
 from pyscheduler.events import EventCache
+from pyscheduler.keys import idstringify
 from pyscheduler.models import enums as e
 from pyscheduler.models import types as t
-from pyscheduler.models.data import runtime as r
 from pyscheduler.models.data import storage as s
 from pyscheduler.protocols.lock import Lock
 from pyscheduler.protocols.store import Store
 
 
-@dataclass(kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CancelledTaskResult:
     """Result of a cancelled task."""
 
     status: Literal[e.Status.CANCELLED]
 
 
-@dataclass(kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FailedTaskResult:
     """Result of a failed task."""
 
@@ -27,7 +26,7 @@ class FailedTaskResult:
     error: str
 
 
-@dataclass(kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CompletedTaskResult:
     """Result of a completed task."""
 
@@ -37,6 +36,8 @@ class CompletedTaskResult:
 
 TaskResult = CancelledTaskResult | FailedTaskResult | CompletedTaskResult
 
+CANCELLED_TASK_RESULT = CancelledTaskResult(status=e.Status.CANCELLED)
+
 
 class ResultResolver:
     """Resolves results of tasks."""
@@ -45,58 +46,59 @@ class ResultResolver:
         self._store = store
         self._lock = lock
         self._cache = cache
+        self._resolvers = {
+            e.Status.CANCELLED: self._resolve_cancelled,
+            e.Status.FAILED: self._resolve_failed,
+            e.Status.COMPLETED: self._resolve_completed,
+        }
 
-    async def _wait_until_finished(self, task_id: UUID) -> None:
-        try:
-            finished = await self._cache.get(f"finished:{task_id}")
-            await finished.wait()
-        except asyncio.CancelledError:
-            pass
-
-    async def _get_state(self) -> r.State:
+    async def _get_state(self) -> s.State:
         async with self._lock:
-            state = await self._store.get()
-
-        return r.State.deserialize(state)
-
-    def _resolve_from_status(
-        self, status: e.Status, task_id: UUID, state: r.State
-    ) -> TaskResult | None:
-        match status:
-            case e.Status.CANCELLED:
-                return CancelledTaskResult(status=status)
-            case e.Status.FAILED:
-                failed = state.tasks.failed[task_id]
-                return FailedTaskResult(status=status, error=failed.error)
-            case e.Status.COMPLETED:
-                completed = state.tasks.completed[task_id]
-                return CompletedTaskResult(status=status, result=completed.result)
-            case _:
-                return None
+            return await self._store.get()
 
-    async def resolve(self, task_id: UUID) -> TaskResult | None:
-        """Resolve the result of a task."""
-        wait_until_finished = asyncio.create_task(self._wait_until_finished(task_id))
+    def _resolve_cancelled(self, task_id: str, state: s.State) -> TaskResult:
+        return CANCELLED_TASK_RESULT
 
-        try:
-            state = await self._get_state()
-            status = state.statuses.get(task_id)
+    def _resolve_failed(self, task_id: str, state: s.State) -> TaskResult:
+        failed = state["tasks"]["failed"][task_id]
+        return FailedTaskResult(status=e.Status.FAILED, error=failed["error"])
 
-            if status is None:
-                return None
+    def _resolve_completed(self, task_id: str, state: s.State) -> TaskResult:
+        completed = state["tasks"]["completed"][task_id]
+        return CompletedTaskResult(
+            status=e.Status.COMPLETED, result=completed["result"]
+        )
 
-            if result := self._resolve_from_status(status, task_id, state):
-                return result
+    async def _lookup(self, key: str) -> tuple[e.Status | None, TaskResult | None]:
+        state = await self._get_state()
+        value = state["statuses"].get(key)
 
-            await wait_until_finished
-        finally:
-            wait_until_finished.cancel()
-            await wait_until_finished
+        if value is None:
+            return None, None
 
-        state = await self._get_state()
-        status = state.statuses.get(task_id)
+        status = e.Status(value)
+        resolver = self._resolvers.get(status)
+
+        if resolver is None:
+            return status, None
+
+        return status, resolver(key, state)
+
+    async def resolve(self, task_id: UUID) -> TaskResult | None:
+        """Resolve the result of a task."""
+        key = idstringify(task_id)
+        status, result = await self._lookup(key)
+
+        if status is None or result is not None:
+            return result
+
+        finished = await self._cache.get("finished", task_id)
+        status, result = await self._lookup(key)
+
+        if status is None or result is not None:
+            return result
 
-        if status is None:
-            return None
+        await finished.wait()
 
-        return self._resolve_from_status(status, task_id, state)
+        _, result = await self._lookup(key)
+        return result
@@ -1,5 +1,7 @@
 import asyncio
+from uuid import UUID
 
+from pyscheduler.keys import keystringify
 from pyscheduler.protocols.event import Event, EventFactory
 
 
@@ -7,7 +9,7 @@ class EventCache:
     """Cache for events."""
 
     _factory: EventFactory
-    _cache: dict[str, Event]
+    _cache: dict[tuple[str, int], Event]
     _lock: asyncio.Lock
 
     def __init__(self, factory: EventFactory) -> None:
@@ -15,18 +17,27 @@ class EventCache:
         self._cache = {}
         self._lock = asyncio.Lock()
 
-    async def get(self, topic: str) -> Event:
-        """Get an event for the given topic."""
+    async def get(self, kind: str, task_id: UUID) -> Event:
+        """Get an event of the given kind for the given task."""
+        task_key = task_id.int
+        key = (kind, task_key)
+
+        event = self._cache.get(key)
+        if event is not None:
+            return event
+
         async with self._lock:
-            if topic not in self._cache:
-                self._cache[topic] = await self._factory.create(topic)
+            event = self._cache.get(key)
+            if event is None:
+                event = await self._factory.create(f"{kind}:{keystringify(task_key)}")
+                self._cache[key] = event
 
-            return self._cache[topic]
+            return event
 
-    async def delete(self, topic: str) -> None:
-        """Delete the event for the given topic from the cache."""
+    async def delete(self, kind: str, task_id: UUID) -> None:
+        """Delete the event of the given kind for the given task from the cache."""
         async with self._lock:
-            self._cache.pop(topic, None)
+            self._cache.pop((kind, task_id.int), None)
 
     async def clear(self) -> None:
         """Clear the cache."""
@@ -0,0 +1,34 @@
+from functools import lru_cache
+from uuid import UUID
+
+# Runtime state is keyed by the integer value of task ids,
+# because hashing UUID objects goes through Python code and ints hash in C.
+# The same ids are converted over and over, so recent ones are cached.
+
+
+@lru_cache(maxsize=2**16)
+def keyparse(value: str) -> int:
+    """Parse a task id string to a key."""
+    return UUID(value).int
+
+
+@lru_cache(maxsize=2**16)
+def keystringify(key: int) -> str:
+    """Convert a key to a task id string."""
+    return str(UUID(int=key))
+
+
+@lru_cache(maxsize=2**16)
+def keyuuid(key: int) -> UUID:
+    """Convert a key to a task id."""
+    return UUID(int=key)
+
+
+def idparse(value: str) -> UUID:
+    """Parse a task id string to a task id."""
+    return keyuuid(keyparse(value))
+
+
+def idstringify(task_id: UUID) -> str:
+    """Convert a task id to a string."""
+    return keystringify(task_id.int)
@@ -1,18 +1,25 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Self, override
 from uuid import UUID
 
+from pyscheduler.keys import idparse, idstringify, keyparse, keystringify
 from pyscheduler.models import enums as e
-from pyscheduler.models import types as t
+from pyscheduler.models import transfer as t
+from pyscheduler.models import types
 from pyscheduler.models.data import storage as s
 from pyscheduler.time import isoparse, isostringify
 
+_statuses = {status.value: status for status in e.Status}
+
 
 class BaseModel[S](ABC):
     """Base class for runtime data models."""
 
+    __slots__ = ()
+
     @abstractmethod
     def serialize(self) -> S:
         """Serialize the model to a storage model."""
@@ -23,12 +30,42 @@ class BaseModel[S](ABC):
         """Deserialize the model from a storage model."""
 
 
-@dataclass(kw_only=True)
+class SerializedModel[S](BaseModel[S]):
+    """Base class for frozen runtime data models with a cached serialized form."""
+
+    __slots__ = ("_serialized",)
+
+    _serialized: S
+
+    @abstractmethod
+    def _serialize(self) -> S:
+        """Serialize the model without using the cached form."""
+
+    def _cache(self, data: S) -> None:
+        # The cached form is not model data, so it is set past the frozen check
+        object.__setattr__(self, "_serialized", data)
+
+    @override
+    def serialize(self) -> S:
+        serialized = getattr(self, "_serialized", None)
+
+        if serialized is None:
+            serialized = self._serialize()
+            self._cache(serialized)
+
+        return serialized
+
+
+@dataclass(frozen=True, slots=True)
 class Specification(BaseModel[s.Specification]):
     """Generic specification for type-based implementation."""
 
     type: str
-    parameters: dict[str, t.JSON]
+    parameters: dict[str, types.JSON]
+
+    def to_transfer(self) -> t.Specification:
+        """Convert the model to a transfer model."""
+        return t.Specification(type=self.type, parameters=self.parameters)
 
     @override
     def serialize(self) -> s.Specification:
@@ -41,50 +78,66 @@ class Specification(BaseModel[s.Specification]):
     @override
     def deserialize(cls, data: s.Specification) -> Self:
         return cls(
-            type=data["type"],
-            parameters=data["parameters"],
+            data["type"],
+            data["parameters"],
         )
 
 
-@dataclass(kw_only=True)
-class Task(BaseModel[s.Task]):
+@dataclass(frozen=True, slots=True)
+class Task(SerializedModel[s.Task]):
     """Core task data."""
 
     operation: Specification
     condition: Specification
     dependencies: dict[str, UUID]
 
+    def to_transfer(self, task_id: UUID) -> t.Task:
+        """Convert the model to a transfer model."""
+        return t.Task(
+            id=task_id,
+            operation=self.operation.to_transfer(),
+            condition=self.condition.to_transfer(),
+            dependencies=dict(self.dependencies),
+        )
+
     @override
-    def serialize(self) -> s.Task:
+    def _serialize(self) -> s.Task:
         return {
             "operation": self.operation.serialize(),
             "condition": self.condition.serialize(),
             "dependencies": {
-                key: str(value) for key, value in self.dependencies.items()
+                key: idstringify(value) for key, value in self.dependencies.items()
             },
         }
 
     @classmethod
     @override
     def deserialize(cls, data: s.Task) -> Self:
-        return cls(
-            operation=Specification.deserialize(data["operation"]),
-            condition=Specification.deserialize(data["condition"]),
-            dependencies={
-                key: UUID(value) for key, value in data["dependencies"].items()
-            },
+        model = cls(
+            Specification.deserialize(data["operation"]),
+            Specification.deserialize(data["condition"]),
+            {key: idparse(value) for key, value in data["dependencies"].items()},
         )
+        model._cache(data)
+        return model
 
 
-@dataclass(kw_only=True)
-class PendingTask(BaseModel[s.PendingTask]):
+@dataclass(frozen=True, slots=True)
+class PendingTask(SerializedModel[s.PendingTask]):
     """Data of a pending task."""
 
     task: Task
     scheduled: datetime
 
+    def to_transfer(self, task_id: UUID) -> t.PendingTask:
+        """Convert the model to a transfer model."""
+        return t.PendingTask(
+            task=self.task.to_transfer(task_id),
+            scheduled=self.scheduled,
+        )
+
     @override
-    def serialize(self) -> s.PendingTask:
+    def _serialize(self) -> s.PendingTask:
         return {
             "task": self.task.serialize(),
             "scheduled": isostringify(self.scheduled),
@@ -93,22 +146,32 @@ class PendingTask(BaseModel[s.PendingTask]):
     @classmethod
     @override
     def deserialize(cls, data: s.PendingTask) -> Self:
-        return cls(
-            task=Task.deserialize(data["task"]),
-            scheduled=isoparse(data["scheduled"]),
+        model = cls(
+            Task.deserialize(data["task"]),
+            isoparse(data["scheduled"]),
         )
+        model._cache(data)
+        return model
 
 
-@dataclass(kw_only=True)
-class RunningTask(BaseModel[s.RunningTask]):
+@dataclass(frozen=True, slots=True)
+class RunningTask(SerializedModel[s.RunningTask]):
     """Data of a running task."""
 
     task: Task
     scheduled: datetime
     started: datetime
 
+    def to_transfer(self, task_id: UUID) -> t.RunningTask:
+        """Convert the model to a transfer model."""
+        return t.RunningTask(
+            task=self.task.to_transfer(task_id),
+            scheduled=self.scheduled,
+            started=self.started,
+        )
+
     @override
-    def serialize(self) -> s.RunningTask:
+    def _serialize(self) -> s.RunningTask:
         return {
             "task": self.task.serialize(),
             "scheduled": isostringify(self.scheduled),
@@ -118,15 +181,17 @@ class RunningTask(BaseModel[s.RunningTask]):
     @classmethod
     @override
     def deserialize(cls, data: s.RunningTask) -> Self:
-        return cls(
-            task=Task.deserialize(data["task"]),
-            scheduled=isoparse(data["scheduled"]),
-            started=isoparse(data["started"]),
+        model = cls(
+            Task.deserialize(data["task"]),
+            isoparse(data["scheduled"]),
+            isoparse(data["started"]),
         )
+        model._cache(data)
+        return model
 
 
-@dataclass(kw_only=True)
-class CancelledTask(BaseModel[s.CancelledTask]):
+@dataclass(frozen=True, slots=True)
+class CancelledTask(SerializedModel[s.CancelledTask]):
     """Data of a cancelled task."""
 
     task: Task
@@ -134,30 +199,41 @@ class CancelledTask(BaseModel[s.CancelledTask]):
     started: datetime | None
     cancelled: datetime
 
+    def to_transfer(self, task_id: UUID) -> t.CancelledTask:
+        """Convert the model to a transfer model."""
+        return t.CancelledTask(
+            task=self.task.to_transfer(task_id),
+            scheduled=self.scheduled,
+            started=self.started,
+            cancelled=self.cancelled,
+        )
+
     @override
-    def serialize(self) -> s.CancelledTask:
+    def _serialize(self) -> s.CancelledTask:
         return {
             "task": self.task.serialize(),
             "scheduled": isostringify(self.scheduled),
-            "started": isostringify(self.started) if self.started is not None else None,
+            "started": (
+                isostringify(self.started) if self.started is not None else None
+            ),
             "cancelled": isostringify(self.cancelled),
         }
 
     @classmethod
     @override
     def deserialize(cls, data: s.CancelledTask) -> Self:
-        return cls(
-            task=Task.deserialize(data["task"]),
-            scheduled=isoparse(data["scheduled"]),
-            started=(
-                isoparse(data["started"]) if data["started"] is not None else None
-            ),
-            cancelled=isoparse(data["cancelled"]),
+        model = cls(
+            Task.deserialize(data["task"]),
+            isoparse(data["scheduled"]),
+            (isoparse(data["started"]) if data["started"] is not None else None),
+            isoparse(data["cancelled"]),
         )
+        model._cache(data)
+        return model
 
 
-@dataclass(kw_only=True)
-class FailedTask(BaseModel[s.FailedTask]):
+@dataclass(frozen=True, slots=True)
+class FailedTask(SerializedModel[s.FailedTask]):
     """Data of a failed task."""
 
     task: Task
@@ -166,8 +242,18 @@ class FailedTask(BaseModel[s.FailedTask]):
     failed: datetime
     error: str
 
+    def to_transfer(self, task_id: UUID) -> t.FailedTask:
+        """Convert the model to a transfer model."""
+        return t.FailedTask(
+            task=self.task.to_transfer(task_id),
+            scheduled=self.scheduled,
+            started=self.started,
+            failed=self.failed,
+            error=self.error,
+        )
+
     @override
-    def serialize(self) -> s.FailedTask:
+    def _serialize(self) -> s.FailedTask:
         return {
             "task": self.task.serialize(),
             "scheduled": isostringify(self.scheduled),
@@ -179,27 +265,39 @@ class FailedTask(BaseModel[s.FailedTask]):
     @classmethod
     @override
     def deserialize(cls, data: s.FailedTask) -> Self:
-        return cls(
-            task=Task.deserialize(data["task"]),
-            scheduled=isoparse(data["scheduled"]),
-            started=isoparse(data["started"]),
-            failed=isoparse(data["failed"]),
-            error=data["error"],
+        model = cls(
+            Task.deserialize(data["task"]),
+            isoparse(data["scheduled"]),
+            isoparse(data["started"]),
+            isoparse(data["failed"]),
+            data["error"],
         )
+        model._cache(data)
+        return model
 
 
-@dataclass(kw_only=True)
-class CompletedTask(BaseModel[s.CompletedTask]):
+@dataclass(frozen=True, slots=True)
+class CompletedTask(SerializedModel[s.CompletedTask]):
     """Data of a completed task."""
 
     task: Task
     scheduled: datetime
     started: datetime
     completed: datetime
-    result: t.JSON
+    result: types.JSON
+
+    def to_transfer(self, task_id: UUID) -> t.CompletedTask:
+        """Convert the model to a transfer model."""
+        return t.CompletedTask(
+            task=self.task.to_transfer(task_id),
+            scheduled=self.scheduled,
+            started=self.started,
+            completed=self.completed,
+            result=self.result,
+        )
 
     @override
-    def serialize(self) -> s.CompletedTask:
+    def _serialize(self) -> s.CompletedTask:
         return {
             "task": self.task.serialize(),
             "scheduled": isostringify(self.scheduled),
@@ -211,141 +309,133 @@ class CompletedTask(BaseModel[s.CompletedTask]):
     @classmethod
     @override
     def deserialize(cls, data: s.CompletedTask) -> Self:
-        return cls(
-            task=Task.deserialize(data["task"]),
-            scheduled=isoparse(data["scheduled"]),
-            started=isoparse(data["started"]),
-            completed=isoparse(data["completed"]),
-            result=data["result"],
+        model = cls(
+            Task.deserialize(data["task"]),
+            isoparse(data["scheduled"]),
+            isoparse(data["started"]),
+            isoparse(data["completed"]),
+            data["result"],
         )
+        model._cache(data)
+        return model
+
+
+def _serialize_tasks[S](data: Mapping[int, BaseModel[S]]) -> dict[str, S]:
+    return {keystringify(key): value.serialize() for key, value in data.items()}
+
 
+def _deserialize_tasks[R: BaseModel, S](
+    data: dict[str, S], model: type[R]
+) -> dict[int, R]:
+    return {keyparse(key): model.deserialize(value) for key, value in data.items()}
 
-@dataclass(kw_only=True)
+
+def _serialize_relations(data: dict[int, set[int]]) -> dict[str, list[str]]:
+    return {
+        keystringify(key): [keystringify(value) for value in values]
+        for key, values in data.items()
+    }
+
+
+def _deserialize_relations(data: dict[str, list[str]]) -> dict[int, set[int]]:
+    return {
+        keyparse(key): {keyparse(value) for value in values}
+        for key, values in data.items()
+    }
+
+
+@dataclass(slots=True)
 class Tasks(BaseModel[s.Tasks]):
     """Tasks data organized by status."""
 
-    pending: dict[UUID, PendingTask]
-    running: dict[UUID, RunningTask]
-    cancelled: dict[UUID, CancelledTask]
-    failed: dict[UUID, FailedTask]
-    completed: dict[UUID, CompletedTask]
+    pending: dict[int, PendingTask]
+    running: dict[int, RunningTask]
+    cancelled: dict[int, CancelledTask]
+    failed: dict[int, FailedTask]
+    completed: dict[int, CompletedTask]
+
+    def with_status(
+        self, status: e.Status
+    ) -> (
+        dict[int, PendingTask]
+        | dict[int, RunningTask]
+        | dict[int, CancelledTask]
+        | dict[int, FailedTask]
+        | dict[int, CompletedTask]
+    ):
+        """Return the tasks with the given status."""
+        match status:
+            case e.Status.PENDING:
+                return self.pending
+            case e.Status.RUNNING:
+                return self.running
+            case e.Status.CANCELLED:
+                return self.cancelled
+            case e.Status.FAILED:
+                return self.failed
+            case e.Status.COMPLETED:
+                return self.completed
 
     @override
     def serialize(self) -> s.Tasks:
-        class Serializer[R: BaseModel, S]:
-            def serialize(self, data: dict[UUID, R]) -> dict[str, S]:
-                return {str(key): value.serialize() for key, value in data.items()}
-
         return {
-            "pending": Serializer[PendingTask, s.PendingTask]().serialize(
-                self.pending,
-            ),
-            "running": Serializer[RunningTask, s.RunningTask]().serialize(
-                self.running,
-            ),
-            "cancelled": Serializer[CancelledTask, s.CancelledTask]().serialize(
-                self.cancelled,
-            ),
-            "failed": Serializer[FailedTask, s.FailedTask]().serialize(
-                self.failed,
-            ),
-            "completed": Serializer[CompletedTask, s.CompletedTask]().serialize(
-                self.completed,
-            ),
+            "pending": _serialize_tasks(self.pending),
+            "running": _serialize_tasks(self.running),
+            "cancelled": _serialize_tasks(self.cancelled),
+            "failed": _serialize_tasks(self.failed),
+            "completed": _serialize_tasks(self.completed),
         }
 
     @classmethod
     @override
     def deserialize(cls, data: s.Tasks) -> Self:
-        class Deserializer[R: BaseModel, S]:
-            def __init__(self, model: type[R]) -> None:
-                self._model = model
-
-            def deserialize(self, data: dict[str, S]) -> dict[UUID, R]:
-                return {
-                    UUID(key): self._model.deserialize(value)
-                    for key, value in data.items()
-                }
-
         return cls(
-            pending=Deserializer[PendingTask, s.PendingTask](
-                PendingTask,
-            ).deserialize(
-                data["pending"],
-            ),
-            running=Deserializer[RunningTask, s.RunningTask](
-                RunningTask,
-            ).deserialize(
-                data["running"],
-            ),
-            cancelled=Deserializer[CancelledTask, s.CancelledTask](
-                CancelledTask,
-            ).deserialize(
-                data["cancelled"],
-            ),
-            failed=Deserializer[FailedTask, s.FailedTask](
-                FailedTask,
-            ).deserialize(
-                data["failed"],
-            ),
-            completed=Deserializer[CompletedTask, s.CompletedTask](
-                CompletedTask,
-            ).deserialize(
-                data["completed"],
-            ),
+            _deserialize_tasks(data["pending"], PendingTask),
+            _deserialize_tasks(data["running"], RunningTask),
+            _deserialize_tasks(data["cancelled"], CancelledTask),
+            _deserialize_tasks(data["failed"], FailedTask),
+            _deserialize_tasks(data["completed"], CompletedTask),
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True)
 class Relationships(BaseModel[s.Relationships]):
     """Relationships between tasks."""
 
-    dependents: dict[UUID, set[UUID]]
-    dependencies: dict[UUID, set[UUID]]
+    dependents: dict[int, set[int]]
+    dependencies: dict[int, set[int]]
 
     @override
     def serialize(self) -> s.Relationships:
-        class Serializer:
-            def serialize(self, data: dict[UUID, set[UUID]]) -> dict[str, list[str]]:
-                return {
-                    str(key): [str(value) for value in values]
-                    for key, values in data.items()
-                }
-
         return {
-            "dependents": Serializer().serialize(self.dependents),
-            "dependencies": Serializer().serialize(self.dependencies),
+            "dependents": _serialize_relations(self.dependents),
+            "dependencies": _serialize_relations(self.dependencies),
         }
 
     @classmethod
     @override
     def deserialize(cls, data: s.Relationships) -> Self:
-        class Deserializer:
-            def deserialize(self, data: dict[str, list[str]]) -> dict[UUID, set[UUID]]:
-                return {
-                    UUID(key): {UUID(value) for value in values}
-                    for key, values in data.items()
-                }
-
         return cls(
-            dependents=Deserializer().deserialize(data["dependents"]),
-            dependencies=Deserializer().deserialize(data["dependencies"]),
+            _deserialize_relations(data["dependents"]),
+            _deserialize_relations(data["dependencies"]),
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True)
 class State(BaseModel[s.State]):
     """State of the scheduler."""
 
     tasks: Tasks
-    statuses: dict[UUID, e.Status]
+    statuses: dict[int, e.Status]
     relationships: Relationships
 
     @override
     def serialize(self) -> s.State:
         return {
             "tasks": self.tasks.serialize(),
-            "statuses": {str(key): value.value for key, value in self.statuses.items()},
+            "statuses": {
+                keystringify(key): value.value for key, value in self.statuses.items()
+            },
             "relationships": self.relationships.serialize(),
         }
 
@@ -353,9 +443,10 @@ class State(BaseModel[s.State]):
     @override
     def deserialize(cls, data: s.State) -> Self:
         return cls(
-            tasks=Tasks.deserialize(data["tasks"]),
-            statuses={
-                UUID(key): e.Status(value) for key, value in data["statuses"].items()
+            Tasks.deserialize(data["tasks"]),
+            {
+                keyparse(key): _statuses[value]
+                for key, value in data["statuses"].items()
             },
-            relationships=Relationships.deserialize(data["relationships"]),
+            Relationships.deserialize(data["relationships"]),
         )
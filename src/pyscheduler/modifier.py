@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from collections import deque
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Protocol
 from uuid import UUID
@@ -8,12 +10,16 @@ from pyscheduler.errors import (
     TaskNotFoundError,
     TaskStatusError,
 )
+from pyscheduler.keys import keyuuid
 from pyscheduler.models import enums as e
 from pyscheduler.models import transfer as t
 from pyscheduler.models import types
 from pyscheduler.models.data import runtime as r
 from pyscheduler.models.data import storage as s
 from pyscheduler.protocols.store import Store
+from pyscheduler.states import StateCache
+
+FINISHED_STATUSES = frozenset({e.Status.CANCELLED, e.Status.FAILED, e.Status.COMPLETED})
 
 
 class RemovePredicate(Protocol):
@@ -27,52 +33,92 @@ class RemovePredicate(Protocol):
 class Modifier:
     """Utility for common state modifications."""
 
-    def __init__(self, store: Store[s.State]) -> None:
+    def __init__(self, store: Store[s.State], cache: StateCache) -> None:
         self._store = store
+        self._cache = cache
+        self._builders = {
+            e.Status.CANCELLED: self._build_cancelled_task,
+            e.Status.FAILED: self._build_failed_task,
+            e.Status.COMPLETED: self._build_completed_task,
+        }
 
     async def _get_state(self) -> r.State:
-        state = await self._store.get()
-        return r.State.deserialize(state)
+        stored = await self._store.get()
+        state = self._cache.get(stored)
+
+        # Forget the state while it is being modified,
+        # so that a failed modification doesn't leak into other reads
+        self._cache.clear()
+
+        return state
 
     async def _save_state(self, state: r.State) -> None:
         serialized_state = state.serialize()
         await self._store.set(serialized_state)
+        self._cache.set(serialized_state, state)
+
+    def _check_dependencies(self, state: r.State, task_id: UUID, task: r.Task) -> None:
+        for dependency in task.dependencies.values():
+            if dependency.int not in state.statuses:
+                raise DependencyNotFoundError(task_id)
+
+    def _add_task(
+        self, state: r.State, task_id: UUID, task: r.Task, scheduled: datetime
+    ) -> r.PendingTask:
+        key = task_id.int
+        pending_task = r.PendingTask(task=task, scheduled=scheduled)
+        state.tasks.pending[key] = pending_task
+        state.statuses[key] = e.Status.PENDING
+
+        if task.dependencies:
+            dependencies = {dependency.int for dependency in task.dependencies.values()}
+            state.relationships.dependencies[key] = dependencies
+
+            dependents = state.relationships.dependents
+            for dependency in dependencies:
+                dependents.setdefault(dependency, set()).add(key)
+
+        return pending_task
 
     async def add_pending_task(
         self, task_id: UUID, task: r.Task, scheduled: datetime
     ) -> r.PendingTask:
         """Add a task to the state."""
         state = await self._get_state()
+        self._check_dependencies(state, task_id, task)
+        pending_task = self._add_task(state, task_id, task, scheduled)
 
-        for dependency in task.dependencies.values():
-            if dependency not in state.statuses:
-                raise DependencyNotFoundError(task_id)
+        await self._save_state(state)
 
-        pending_task = r.PendingTask(task=task, scheduled=scheduled)
-        state.tasks.pending[task_id] = pending_task
-        state.statuses[task_id] = e.Status.PENDING
+        return pending_task
 
-        dependencies = set(pending_task.task.dependencies.values())
+    async def add_pending_tasks(
+        self, tasks: Sequence[tuple[UUID, r.Task]], scheduled: datetime
+    ) -> list[r.PendingTask]:
+        """Add multiple tasks to the state."""
+        if not tasks:
+            return []
 
-        if dependencies:
-            state.relationships.dependencies[task_id] = dependencies
+        state = await self._get_state()
 
-        for dependency in dependencies:
-            if dependency not in state.relationships.dependents:
-                state.relationships.dependents[dependency] = set()
+        for task_id, task in tasks:
+            self._check_dependencies(state, task_id, task)
 
-            state.relationships.dependents[dependency].add(task_id)
+        pending_tasks = [
+            self._add_task(state, task_id, task, scheduled) for task_id, task in tasks
+        ]
 
         await self._save_state(state)
 
-        return pending_task
+        return pending_tasks
 
     async def move_task_to_running(
         self, task_id: UUID, started: datetime
     ) -> r.RunningTask:
         """Move a task to the running state."""
         state = await self._get_state()
-        status = state.statuses.get(task_id)
+        key = task_id.int
+        status = state.statuses.get(key)
 
         if status is None:
             raise TaskNotFoundError(task_id)
@@ -80,35 +126,34 @@ class Modifier:
         if status != e.Status.PENDING:
             raise TaskStatusError(task_id, status)
 
-        task = state.tasks.pending.pop(task_id, None)
+        task = state.tasks.pending.pop(key, None)
 
         if task is None:
             raise TaskNotFoundError(task_id)
 
         task = r.RunningTask(task=task.task, scheduled=task.scheduled, started=started)
-        state.tasks.running[task_id] = task
-        state.statuses[task_id] = e.Status.RUNNING
+        state.tasks.running[key] = task
+        state.statuses[key] = e.Status.RUNNING
 
         await self._save_state(state)
 
         return task
 
-    async def move_task_to_cancelled(
-        self, task_id: UUID, cancelled: datetime
+    def _cancel_task(
+        self, state: r.State, task_id: UUID, cancelled: datetime
     ) -> r.CancelledTask:
-        """Move a task to the cancelled state."""
-        state = await self._get_state()
-        status = state.statuses.get(task_id)
+        key = task_id.int
+        status = state.statuses.get(key)
 
         if status is None:
             raise TaskNotFoundError(task_id)
 
         match status:
             case e.Status.PENDING:
-                task = state.tasks.pending.pop(task_id, None)
+                task = state.tasks.pending.pop(key, None)
                 started = None
             case e.Status.RUNNING:
-                task = state.tasks.running.pop(task_id, None)
+                task = state.tasks.running.pop(key, None)
                 started = task.started if task is not None else None
             case _:
                 raise TaskStatusError(task_id, status)
@@ -122,19 +167,43 @@ class Modifier:
             started=started,
             cancelled=cancelled,
         )
-        state.tasks.cancelled[task_id] = task
-        state.statuses[task_id] = e.Status.CANCELLED
+        state.tasks.cancelled[key] = task
+        state.statuses[key] = e.Status.CANCELLED
+
+        return task
+
+    async def move_task_to_cancelled(
+        self, task_id: UUID, cancelled: datetime
+    ) -> r.CancelledTask:
+        """Move a task to the cancelled state."""
+        state = await self._get_state()
+        task = self._cancel_task(state, task_id, cancelled)
 
         await self._save_state(state)
 
         return task
 
+    async def move_tasks_to_cancelled(
+        self, task_ids: Sequence[UUID], cancelled: datetime
+    ) -> list[r.CancelledTask]:
+        """Move multiple tasks to the cancelled state."""
+        if not task_ids:
+            return []
+
+        state = await self._get_state()
+        tasks = [self._cancel_task(state, task_id, cancelled) for task_id in task_ids]
+
+        await self._save_state(state)
+
+        return tasks
+
     async def move_task_to_failed(
         self, task_id: UUID, failed: datetime, error: str
     ) -> r.FailedTask:
         """Move a task to the failed state."""
         state = await self._get_state()
-        status = state.statuses.get(task_id)
+        key = task_id.int
+        status = state.statuses.get(key)
 
         if status is None:
             raise TaskNotFoundError(task_id)
@@ -142,7 +211,7 @@ class Modifier:
         if status != e.Status.RUNNING:
             raise TaskStatusError(task_id, status)
 
-        task = state.tasks.running.pop(task_id, None)
+        task = state.tasks.running.pop(key, None)
 
         if task is None:
             raise TaskNotFoundError(task_id)
@@ -154,8 +223,8 @@ class Modifier:
             failed=failed,
             error=error,
         )
-        state.tasks.failed[task_id] = task
-        state.statuses[task_id] = e.Status.FAILED
+        state.tasks.failed[key] = task
+        state.statuses[key] = e.Status.FAILED
 
         await self._save_state(state)
 
@@ -166,7 +235,8 @@ class Modifier:
     ) -> r.CompletedTask:
         """Move a task to the completed state."""
         state = await self._get_state()
-        status = state.statuses.get(task_id)
+        key = task_id.int
+        status = state.statuses.get(key)
 
         if status is None:
             raise TaskNotFoundError(task_id)
@@ -174,7 +244,7 @@ class Modifier:
         if status != e.Status.RUNNING:
             raise TaskStatusError(task_id, status)
 
-        task = state.tasks.running.pop(task_id, None)
+        task = state.tasks.running.pop(key, None)
 
         if task is None:
             raise TaskNotFoundError(task_id)
@@ -186,133 +256,72 @@ class Modifier:
             completed=completed,
             result=result,
         )
-        state.tasks.completed[task_id] = task
-        state.statuses[task_id] = e.Status.COMPLETED
+        state.tasks.completed[key] = task
+        state.statuses[key] = e.Status.COMPLETED
 
         await self._save_state(state)
 
         return task
 
-    def _build_finished_task(self, task_id: UUID, state: r.State) -> t.FinishedTask:
-        status = state.statuses[task_id]
+    def _build_cancelled_task(self, key: int, state: r.State) -> t.CancelledTask:
+        return state.tasks.cancelled[key].to_transfer(keyuuid(key))
 
-        match status:
-            case e.Status.CANCELLED:
-                task = state.tasks.cancelled[task_id]
-                return t.CancelledTask(
-                    task=t.Task(
-                        id=task_id,
-                        operation=t.Specification(
-                            type=task.task.operation.type,
-                            parameters=task.task.operation.parameters,
-                        ),
-                        condition=t.Specification(
-                            type=task.task.condition.type,
-                            parameters=task.task.condition.parameters,
-                        ),
-                        dependencies=task.task.dependencies,
-                    ),
-                    scheduled=task.scheduled,
-                    started=task.started,
-                    cancelled=task.cancelled,
-                )
-            case e.Status.FAILED:
-                task = state.tasks.failed[task_id]
-                return t.FailedTask(
-                    task=t.Task(
-                        id=task_id,
-                        operation=t.Specification(
-                            type=task.task.operation.type,
-                            parameters=task.task.operation.parameters,
-                        ),
-                        condition=t.Specification(
-                            type=task.task.condition.type,
-                            parameters=task.task.condition.parameters,
-                        ),
-                        dependencies=task.task.dependencies,
-                    ),
-                    scheduled=task.scheduled,
-                    started=task.started,
-                    failed=task.failed,
-                    error=task.error,
-                )
-            case e.Status.COMPLETED:
-                task = state.tasks.completed[task_id]
-                return t.CompletedTask(
-                    task=t.Task(
-                        id=task_id,
-                        operation=t.Specification(
-                            type=task.task.operation.type,
-                            parameters=task.task.operation.parameters,
-                        ),
-                        condition=t.Specification(
-                            type=task.task.condition.type,
-                            parameters=task.task.condition.parameters,
-                        ),
-                        dependencies=task.task.dependencies,
-                    ),
-                    scheduled=task.scheduled,
-                    started=task.started,
-                    completed=task.completed,
-                    result=task.result,
-                )
-            case _:
-                raise TaskStatusError(task_id, status)
+    def _build_failed_task(self, key: int, state: r.State) -> t.FailedTask:
+        return state.tasks.failed[key].to_transfer(keyuuid(key))
+
+    def _build_completed_task(self, key: int, state: r.State) -> t.CompletedTask:
+        return state.tasks.completed[key].to_transfer(keyuuid(key))
+
+    def _build_finished_task(self, key: int, state: r.State) -> t.FinishedTask:
+        status = state.statuses[key]
+        builder = self._builders.get(status)
+
+        if builder is None:
+            raise TaskStatusError(keyuuid(key), status)
 
-    async def remove_stale_tasks(  # noqa: C901
+        return builder(key, state)
+
+    async def remove_stale_tasks(
         self,
         predicate: RemovePredicate | None = None,
     ) -> set[UUID]:
         """Remove finished tasks that are no longer needed."""
-
-        async def _default_predicate(task: t.FinishedTask) -> bool:
-            return True
-
-        predicate = predicate or _default_predicate
-
         state = await self._get_state()
 
+        dependents = state.relationships.dependents
+
         pool = {
-            task_id
-            for task_id, status in state.statuses.items()
-            if status in (e.Status.CANCELLED, e.Status.FAILED, e.Status.COMPLETED)
+            key for key, status in state.statuses.items() if status in FINISHED_STATUSES
         }
 
-        removed = set[UUID]()
-
-        size = 0
-
-        while len(pool) != size:
-            size = len(pool)
+        # Tasks without dependents can be checked right away,
+        # others only after all their dependents are removed
+        ready = deque(key for key in pool if key not in dependents)
 
-            for task_id in pool.copy():
-                if task_id in state.relationships.dependents:
-                    continue
+        removed = set[UUID]()
 
-                if not await predicate(self._build_finished_task(task_id, state)):
-                    continue
+        while ready:
+            key = ready.popleft()
+            pool.remove(key)
 
-                status = state.statuses[task_id]
+            if predicate is not None and not await predicate(
+                self._build_finished_task(key, state)
+            ):
+                continue
 
-                match status:
-                    case e.Status.CANCELLED:
-                        state.tasks.cancelled.pop(task_id)
-                    case e.Status.FAILED:
-                        state.tasks.failed.pop(task_id)
-                    case e.Status.COMPLETED:
-                        state.tasks.completed.pop(task_id)
+            state.tasks.with_status(state.statuses.pop(key)).pop(key)
 
-                state.statuses.pop(task_id)
+            dependencies = state.relationships.dependencies.pop(key, set())
+            for dependency in dependencies:
+                if dependency in dependents:
+                    dependents[dependency].remove(key)
+                    if not dependents[dependency]:
+                        dependents.pop(dependency)
 
-                dependencies = state.relationships.dependencies.pop(task_id, set())
-                for dependency in dependencies:
-                    if dependency in state.relationships.dependents:
-                        state.relationships.dependents[dependency].remove(task_id)
-                        if not state.relationships.dependents[dependency]:
-                            state.relationships.dependents.pop(dependency)
+                        if dependency in pool:
+                            ready.append(dependency)
 
-                pool.remove(task_id)
-                removed.add(task_id)
+            removed.add(keyuuid(key))
 
         await self._save_state(state)
 
@@ -3,7 +3,12 @@ from typing import Protocol
 
 
 class Store[T](Protocol):
-    """Supports getting and setting a value."""
+    """Supports getting and setting a value.
+
+    Values must not be modified in place after they are set or returned.
+    A new value has to be a new object, because the scheduler reuses data
+    derived from a value for as long as the same object is returned.
+    """
 
     @abstractmethod
     async def get(self) -> T:
@@ -1,26 +1,28 @@
 from uuid import UUID
 
-from pyscheduler.models import enums as e
+from pyscheduler.keys import keyuuid
 from pyscheduler.models import transfer as t
 from pyscheduler.models.data import runtime as r
 from pyscheduler.models.data import storage as s
 from pyscheduler.protocols.lock import Lock
 from pyscheduler.protocols.store import Store
+from pyscheduler.states import StateCache
 
 
 class BaseReader:
     """Base class for readers."""
 
-    def __init__(self, store: Store[s.State], lock: Lock) -> None:
+    def __init__(self, store: Store[s.State], lock: Lock, cache: StateCache) -> None:
         self._store = store
         self._lock = lock
+        self._cache = cache
 
     async def _get_state(self) -> r.State:
         """Get the current state."""
         async with self._lock:
             state = await self._store.get()
 
-        return r.State.deserialize(state)
+        return self._cache.get(state)
 
 
 class PendingTasksReader(BaseReader):
@@ -29,26 +31,12 @@ class PendingTasksReader(BaseReader):
     async def get(self, task_id: UUID) -> t.PendingTask | None:
         """Get a pending task by id."""
         state = await self._get_state()
-        task = state.tasks.pending.get(task_id)
+        task = state.tasks.pending.get(task_id.int)
 
         if task is None:
             return None
 
-        return t.PendingTask(
-            task=t.Task(
-                id=task_id,
-                operation=t.Specification(
-                    type=task.task.operation.type,
-                    parameters=task.task.operation.parameters,
-                ),
-                condition=t.Specification(
-                    type=task.task.condition.type,
-                    parameters=task.task.condition.parameters,
-                ),
-                dependencies=task.task.dependencies,
-            ),
-            scheduled=task.scheduled,
-        )
+        return task.to_transfer(task_id)
 
 
 class RunningTasksReader(BaseReader):
@@ -57,27 +45,12 @@ class RunningTasksReader(BaseReader):
     async def get(self, task_id: UUID) -> t.RunningTask | None:
         """Get a running task by id."""
         state = await self._get_state()
-        task = state.tasks.running.get(task_id)
+        task = state.tasks.running.get(task_id.int)
 
         if task is None:
             return None
 
-        return t.RunningTask(
-            task=t.Task(
-                id=task_id,
-                operation=t.Specification(
-                    type=task.task.operation.type,
-                    parameters=task.task.operation.parameters,
-                ),
-                condition=t.Specification(
-                    type=task.task.condition.type,
-                    parameters=task.task.condition.parameters,
-                ),
-                dependencies=task.task.dependencies,
-            ),
-            scheduled=task.scheduled,
-            started=task.started,
-        )
+        return task.to_transfer(task_id)
 
 
 class CancelledTasksReader(BaseReader):
@@ -86,28 +59,12 @@ class CancelledTasksReader(BaseReader):
     async def get(self, task_id: UUID) -> t.CancelledTask | None:
         """Get a cancelled task by id."""
         state = await self._get_state()
-        task = state.tasks.cancelled.get(task_id)
+        task = state.tasks.cancelled.get(task_id.int)
 
         if task is None:
             return None
 
-        return t.CancelledTask(
-            task=t.Task(
-                id=task_id,
-                operation=t.Specification(
-                    type=task.task.operation.type,
-                    parameters=task.task.operation.parameters,
-                ),
-                condition=t.Specification(
-                    type=task.task.condition.type,
-                    parameters=task.task.condition.parameters,
-                ),
-                dependencies=task.task.dependencies,
-            ),
-            scheduled=task.scheduled,
-            started=task.started,
-            cancelled=task.cancelled,
-        )
+        return task.to_transfer(task_id)
 
 
 class FailedTasksReader(BaseReader):
@@ -116,29 +73,12 @@ class FailedTasksReader(BaseReader):
     async def get(self, task_id: UUID) -> t.FailedTask | None:
         """Get a failed task by id."""
         state = await self._get_state()
-        task = state.tasks.failed.get(task_id)
+        task = state.tasks.failed.get(task_id.int)
 
         if task is None:
             return None
 
-        return t.FailedTask(
-            task=t.Task(
-                id=task_id,
-                operation=t.Specification(
-                    type=task.task.operation.type,
-                    parameters=task.task.operation.parameters,
-                ),
-                condition=t.Specification(
-                    type=task.task.condition.type,
-                    parameters=task.task.condition.parameters,
-                ),
-                dependencies=task.task.dependencies,
-            ),
-            scheduled=task.scheduled,
-            started=task.started,
-            failed=task.failed,
-            error=task.error,
-        )
+        return task.to_transfer(task_id)
 
 
 class CompletedTasksReader(BaseReader):
@@ -147,41 +87,24 @@ class CompletedTasksReader(BaseReader):
     async def get(self, task_id: UUID) -> t.CompletedTask | None:
         """Get a completed task by id."""
         state = await self._get_state()
-        task = state.tasks.completed.get(task_id)
+        task = state.tasks.completed.get(task_id.int)
 
         if task is None:
             return None
 
-        return t.CompletedTask(
-            task=t.Task(
-                id=task_id,
-                operation=t.Specification(
-                    type=task.task.operation.type,
-                    parameters=task.task.operation.parameters,
-                ),
-                condition=t.Specification(
-                    type=task.task.condition.type,
-                    parameters=task.task.condition.parameters,
-                ),
-                dependencies=task.task.dependencies,
-            ),
-            scheduled=task.scheduled,
-            started=task.started,
-            completed=task.completed,
-            result=task.result,
-        )
+        return task.to_transfer(task_id)
 
 
 class Reader(BaseReader):
     """Reader for tasks."""
 
-    def __init__(self, store: Store[s.State], lock: Lock) -> None:
-        super().__init__(store, lock)
-        self._pending = PendingTasksReader(store, lock)
-        self._running = RunningTasksReader(store, lock)
-        self._cancelled = CancelledTasksReader(store, lock)
-        self._failed = FailedTasksReader(store, lock)
-        self._completed = CompletedTasksReader(store, lock)
+    def __init__(self, store: Store[s.State], lock: Lock, cache: StateCache) -> None:
+        super().__init__(store, lock, cache)
+        self._pending = PendingTasksReader(store, lock, cache)
+        self._running = RunningTasksReader(store, lock, cache)
+        self._cancelled = CancelledTasksReader(store, lock, cache)
+        self._failed = FailedTasksReader(store, lock, cache)
+        self._completed = CompletedTasksReader(store, lock, cache)
 
     @property
     def pending(self) -> PendingTasksReader:
@@ -213,33 +136,25 @@ class Reader(BaseReader):
         state = await self._get_state()
 
         return t.TaskIndex(
-            pending=set(state.tasks.pending.keys()),
-            running=set(state.tasks.running.keys()),
-            cancelled=set(state.tasks.cancelled.keys()),
-            failed=set(state.tasks.failed.keys()),
-            completed=set(state.tasks.completed.keys()),
+            pending=set(map(keyuuid, state.tasks.pending.keys())),
+            running=set(map(keyuuid, state.tasks.running.keys())),
+            cancelled=set(map(keyuuid, state.tasks.cancelled.keys())),
+            failed=set(map(keyuuid, state.tasks.failed.keys())),
+            completed=set(map(keyuuid, state.tasks.completed.keys())),
         )
 
     async def get(self, task_id: UUID) -> t.GenericTask | None:
         """Get a task by id."""
         state = await self._get_state()
-        status = state.statuses.get(task_id)
-
-        match status:
-            case e.Status.PENDING:
-                task = await self._pending.get(task_id)
-                return t.GenericTask(task=task.task, status=status) if task else None
-            case e.Status.RUNNING:
-                task = await self._running.get(task_id)
-                return t.GenericTask(task=task.task, status=status) if task else None
-            case e.Status.CANCELLED:
-                task = await self._cancelled.get(task_id)
-                return t.GenericTask(task=task.task, status=status) if task else None
-            case e.Status.FAILED:
-                task = await self._failed.get(task_id)
-                return t.GenericTask(task=task.task, status=status) if task else None
-            case e.Status.COMPLETED:
-                task = await self._completed.get(task_id)
-                return t.GenericTask(task=task.task, status=status) if task else None
-            case _:
-                return None
+        key = task_id.int
+        status = state.statuses.get(key)
+
+        if status is None:
+            return None
+
+        task = state.tasks.with_status(status).get(key)
+
+        if task is None:
+            return None
+
+        return t.GenericTask(task=task.task.to_transfer(task_id), status=status)
@@ -13,6 +13,7 @@ from pyscheduler.errors import (
     UnsuccessfulDependencyError,
 )
 from pyscheduler.events import EventCache
+from pyscheduler.keys import idstringify
 from pyscheduler.models import enums as e
 from pyscheduler.models import types
 from pyscheduler.models.data import runtime as r
@@ -50,33 +51,38 @@ class Runner:
         self._resolver = ResultResolver(store, lock, cache)
 
     @asynccontextmanager
-    async def _manage_finished_event(self, task_id: UUID) -> AsyncGenerator[Event]:
-        finished = await self._cache.get(f"finished:{task_id}")
+    async def _manage_events(
+        self, task_id: UUID
+    ) -> AsyncGenerator[tuple[Event, Event]]:
+        cancelled = await self._cache.get("cancelled", task_id)
+        finished = await self._cache.get("finished", task_id)
 
         try:
-            yield finished
+            yield cancelled, finished
         finally:
-            await self._cache.delete(f"finished:{task_id}")
+            await self._cache.delete("cancelled", task_id)
+            await self._cache.delete("finished", task_id)
 
     async def _get_task(self, task_id: UUID) -> r.Task:
         async with self._lock:
             state = await self._store.get()
 
-        state = r.State.deserialize(state)
-        status = state.statuses.get(task_id)
+        # Only one task is needed, so look it up without deserializing the state
+        key = idstringify(task_id)
+        status = state["statuses"].get(key)
 
         if status is None:
             raise TaskNotFoundError(task_id)
 
         if status != e.Status.PENDING:
-            raise UnexpectedTaskStatusError(task_id, status)
+            raise UnexpectedTaskStatusError(task_id, e.Status(status))
 
-        task = state.tasks.pending.get(task_id)
+        task = state["tasks"]["pending"].get(key)
 
         if task is None:
             raise TaskNotFoundError(task_id)
 
-        return task.task
+        return r.Task.deserialize(task["task"])
 
     async def _create_operation(self, operation_type: str) -> Operation:
         operation = await self._operations.create(operation_type)
@@ -94,24 +100,32 @@ class Runner:
 
         return condition
 
-    async def _resolve_dependencies(
-        self, dependencies: dict[str, UUID]
-    ) -> dict[str, types.JSON]:
-        deps = {}
+    async def _resolve_dependency(self, dependency: UUID) -> types.JSON:
+        result = await self._resolver.resolve(dependency)
 
-        for parameter, dependency in dependencies.items():
-            result = await self._resolver.resolve(dependency)
+        if result is None:
+            raise DependencyNotFoundError(dependency)
 
-            if result is None:
-                raise DependencyNotFoundError(dependency)
+        match result.status:
+            case e.Status.CANCELLED | e.Status.FAILED:
+                raise UnsuccessfulDependencyError(dependency, result.status)
+            case _:
+                return result.result
 
-            match result.status:
-                case e.Status.CANCELLED | e.Status.FAILED:
-                    raise UnsuccessfulDependencyError(dependency, result.status)
-                case _:
-                    deps[parameter] = result.result
+    async def _resolve_dependencies(
+        self, dependencies: dict[str, UUID]
+    ) -> dict[str, types.JSON]:
+        # The first failing dependency cancels resolving the others
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = {
+                    parameter: group.create_task(self._resolve_dependency(dependency))
+                    for parameter, dependency in dependencies.items()
+                }
+        except ExceptionGroup as ex:
+            raise ex.exceptions[0] from None
 
-        return deps
+        return {parameter: task.result() for parameter, task in tasks.items()}
 
     async def _set_task_as_running(self, task_id: UUID) -> None:
         async with self._lock:
@@ -122,89 +136,84 @@ class Runner:
     ) -> None:
         async with self._lock:
             await self._modifier.move_task_to_failed(task_id, awareutcnow(), error)
-            await finished.notify()
+
+        await finished.notify()
 
     async def _set_task_as_completed(
         self, task_id: UUID, result: types.JSON, finished: Event
     ) -> None:
         async with self._lock:
             await self._modifier.move_task_to_completed(task_id, awareutcnow(), result)
-            await finished.notify()
 
-    async def _monitor_cancellation(self, task_id: UUID) -> None:
-        try:
-            cancelled = await self._cache.get(f"cancelled:{task_id}")
-            await cancelled.wait()
-        except asyncio.CancelledError:
-            pass
+        await finished.notify()
 
-    async def _run_task(self, task_id: UUID) -> None:
+    async def _run_task(self, task_id: UUID, finished: Event) -> None:
         try:
             task = await self._get_task(task_id)
 
-            async with self._manage_finished_event(task_id) as finished:
-                try:
-                    operation = await self._create_operation(task.operation.type)
-                except InvalidOperationError as ex:
-                    error = f"Operation {ex.type} is not supported."
-                    await self._set_task_as_failed(task_id, error, finished)
-                    return
-
-                try:
-                    condition = await self._create_condition(task.condition.type)
-                except InvalidConditionError as ex:
-                    error = f"Condition {ex.type} is not supported."
-                    await self._set_task_as_failed(task_id, error, finished)
-                    return
-
-                try:
-                    dependencies = await self._resolve_dependencies(task.dependencies)
-                except UnsuccessfulDependencyError as ex:
-                    error = f"Dependency {ex.id} finished with status {ex.status}."
-                    await self._set_task_as_failed(task_id, error, finished)
-                    return
-
-                try:
-                    await condition.wait(task.condition.parameters)
-                except asyncio.CancelledError:
-                    raise
-                except Exception as ex:
-                    error = f"Condition {task.condition.type} failed: {ex}."
-                    await self._set_task_as_failed(task_id, error, finished)
-                    return
-
-                await self._set_task_as_running(task_id)
-
-                try:
-                    parameters = task.operation.parameters
-                    result = await operation.run(parameters, dependencies)
-                except asyncio.CancelledError:
-                    raise
-                except Exception as ex:
-                    error = f"Operation {task.operation.type} failed: {ex}."
-                    await self._set_task_as_failed(task_id, error, finished)
-                    return
-
-                await self._set_task_as_completed(task_id, result, finished)
+            try:
+                operation = await self._create_operation(task.operation.type)
+            except InvalidOperationError as ex:
+                error = f"Operation {ex.type} is not supported."
+                await self._set_task_as_failed(task_id, error, finished)
+                return
+
+            try:
+                condition = await self._create_condition(task.condition.type)
+            except InvalidConditionError as ex:
+                error = f"Condition {ex.type} is not supported."
+                await self._set_task_as_failed(task_id, error, finished)
+                return
+
+            try:
+                dependencies = await self._resolve_dependencies(task.dependencies)
+            except UnsuccessfulDependencyError as ex:
+                error = f"Dependency {ex.id} finished with status {ex.status}."
+                await self._set_task_as_failed(task_id, error, finished)
+                return
+
+            try:
+                await condition.wait(task.condition.parameters)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                error = f"Condition {task.condition.type} failed: {ex}."
+                await self._set_task_as_failed(task_id, error, finished)
+                return
+
+            await self._set_task_as_running(task_id)
+
+            try:
+                parameters = task.operation.parameters
+                result = await operation.run(parameters, dependencies)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                error = f"Operation {task.operation.type} failed: {ex}."
+                await self._set_task_as_failed(task_id, error, finished)
+                return
+
+            await self._set_task_as_completed(task_id, result, finished)
         except asyncio.CancelledError:
             pass
 
     async def _handle_task_added(self, task_id: UUID) -> None:
-        run = asyncio.create_task(self._run_task(task_id))
-        monitor = asyncio.create_task(self._monitor_cancellation(task_id))
-
-        try:
-            await asyncio.wait([run, monitor], return_when=asyncio.FIRST_COMPLETED)
-        except asyncio.CancelledError:
-            pass
-        finally:
-            if not run.done():
-                run.cancel()
-
-            if not monitor.done():
-                monitor.cancel()
-
-            await asyncio.wait([run, monitor])
+        async with self._manage_events(task_id) as (cancelled, finished):
+            run = asyncio.create_task(self._run_task(task_id, finished))
+            monitor = asyncio.create_task(cancelled.wait())
+
+            try:
+                await asyncio.wait([run, monitor], return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                if not run.done():
+                    run.cancel()
+
+                if not monitor.done():
+                    monitor.cancel()
+
+                await asyncio.wait([run, monitor])
 
     async def _process_queue(self) -> None:
         handlers = []
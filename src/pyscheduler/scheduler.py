@@ -1,4 +1,4 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 from uuid import UUID
 
@@ -17,6 +17,7 @@ from pyscheduler.protocols.queue import Queue
 from pyscheduler.protocols.store import Store
 from pyscheduler.readers import Reader
 from pyscheduler.runner import Runner
+from pyscheduler.states import StateCache
 
 
 class Scheduler:
@@ -32,9 +33,10 @@ class Scheduler:
         conditions: ConditionFactory,
         cleaning: CleaningStrategyFactory,
     ) -> None:
-        tasks = Reader(store, lock)
+        states = StateCache()
+        tasks = Reader(store, lock, states)
         cache = EventCache(events)
-        modifier = Modifier(store)
+        modifier = Modifier(store, states)
         runner = Runner(store, lock, cache, queue, modifier, operations, conditions)
         adder = Adder(lock, queue, modifier, operations, conditions)
         canceller = Canceller(lock, cache, modifier)
@@ -55,10 +57,29 @@ class Scheduler:
         """Schedule a task."""
         return await self._adder.add(request)
 
+    async def schedule_many(
+        self, requests: Sequence[t.ScheduleRequest]
+    ) -> list[t.PendingTask]:
+        """Schedule multiple tasks.
+
+        Either all tasks are scheduled or, if any of them cannot be, none are.
+        """
+        return await self._adder.add_many(requests)
+
     async def cancel(self, request: t.CancelRequest) -> t.CancelledTask:
         """Cancel a task."""
         return await self._canceller.cancel(request)
 
+    async def cancel_many(
+        self, requests: Sequence[t.CancelRequest]
+    ) -> list[t.CancelledTask]:
+        """Cancel multiple tasks.
+
+        Either all tasks are cancelled or, if any of them cannot be, none are.
+        This includes requests that repeat the same task.
+        """
+        return await self._canceller.cancel_many(requests)
+
     async def clean(self, request: t.CleanRequest) -> t.CleaningResult:
         """Clean tasks."""
         return await self._cleaner.clean(request)
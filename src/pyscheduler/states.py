@@ -0,0 +1,31 @@
+from pyscheduler.models.data import runtime as r
+from pyscheduler.models.data import storage as s
+
+
+class StateCache:
+    """Cache for deserialized states."""
+
+    _stored: s.State | None
+    _state: r.State | None
+
+    def __init__(self) -> None:
+        self._stored = None
+        self._state = None
+
+    def get(self, stored: s.State) -> r.State:
+        """Get the deserialized state for the given stored state."""
+        if stored is not self._stored or self._state is None:
+            self._state = r.State.deserialize(stored)
+            self._stored = stored
+
+        return self._state
+
+    def set(self, stored: s.State, state: r.State) -> None:
+        """Set the deserialized state for the given stored state."""
+        self._stored = stored
+        self._state = state
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._stored = None
+        self._state = None
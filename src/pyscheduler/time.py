@@ -8,11 +8,15 @@ def awareutcnow() -> datetime:
 
 def naiveutcnow() -> datetime:
     """Return the current datetime in UTC without timezone information."""
-    return awareutcnow().replace(tzinfo=None)
+    return datetime.now(UTC).replace(tzinfo=None)
 
 
 def isostringify(dt: datetime) -> str:
     """Convert a datetime to a string in ISO 8601 format."""
+    # Formatting the UTC offset is slow, and it is replaced anyway
+    if dt.tzinfo is UTC:
+        return dt.replace(tzinfo=None).isoformat() + "Z"
+
     return dt.isoformat().replace("+00:00", "Z")
 
 
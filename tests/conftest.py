@@ -0,0 +1,46 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from pyscheduler.scheduler import Scheduler
+from tests.memory import (
+    AllCleaningStrategyFactory,
+    DelayConditionFactory,
+    EchoOperationFactory,
+    MemoryEventFactory,
+    MemoryLock,
+    MemoryQueue,
+    MemoryStore,
+)
+
+
+@pytest.fixture
+def store() -> MemoryStore:
+    """Return an in-memory store."""
+    return MemoryStore()
+
+
+@pytest.fixture
+def queue() -> MemoryQueue:
+    """Return an in-memory queue."""
+    return MemoryQueue()
+
+
+@pytest_asyncio.fixture
+async def scheduler(
+    store: MemoryStore, queue: MemoryQueue
+) -> AsyncGenerator[Scheduler]:
+    """Run a scheduler backed by in-memory implementations."""
+    scheduler = Scheduler(
+        store,
+        MemoryLock(),
+        MemoryEventFactory(),
+        queue,
+        EchoOperationFactory(),
+        DelayConditionFactory(),
+        AllCleaningStrategyFactory(),
+    )
+
+    async with scheduler.run():
+        yield scheduler
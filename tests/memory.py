@@ -0,0 +1,159 @@
+import asyncio
+from types import TracebackType
+from typing import override
+from uuid import UUID
+
+from pyscheduler.models import transfer as t
+from pyscheduler.models import types
+from pyscheduler.models.data import storage as s
+from pyscheduler.protocols.cleaning import CleaningStrategy, CleaningStrategyFactory
+from pyscheduler.protocols.condition import Condition, ConditionFactory
+from pyscheduler.protocols.event import Event, EventFactory
+from pyscheduler.protocols.lock import Lock
+from pyscheduler.protocols.operation import Operation, OperationFactory
+from pyscheduler.protocols.queue import Queue
+from pyscheduler.protocols.store import Store
+
+
+class MemoryStore(Store[s.State]):
+    """Store that keeps the state in memory and counts writes."""
+
+    def __init__(self) -> None:
+        self.value: s.State = {
+            "tasks": {
+                "pending": {},
+                "running": {},
+                "cancelled": {},
+                "failed": {},
+                "completed": {},
+            },
+            "statuses": {},
+            "relationships": {"dependents": {}, "dependencies": {}},
+        }
+        self.writes = 0
+
+    @override
+    async def get(self) -> s.State:
+        return self.value
+
+    @override
+    async def set(self, value: s.State) -> None:
+        self.value = value
+        self.writes += 1
+
+
+class MemoryLock(Lock):
+    """Lock backed by an asyncio lock."""
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+
+    @override
+    async def __aenter__(self) -> None:
+        await self._lock.acquire()
+
+    @override
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._lock.release()
+
+
+class MemoryEvent(Event):
+    """Event backed by an asyncio event."""
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+
+    @override
+    async def wait(self) -> None:
+        await self._event.wait()
+
+    @override
+    async def notify(self) -> None:
+        self._event.set()
+
+
+class MemoryEventFactory(EventFactory):
+    """Factory for in-memory events."""
+
+    @override
+    async def create(self, topic: str) -> Event:
+        return MemoryEvent()
+
+
+class MemoryQueue(Queue[UUID]):
+    """Queue backed by an asyncio queue that records every item put."""
+
+    def __init__(self) -> None:
+        self._queue = asyncio.Queue[UUID]()
+        self.items: list[UUID] = []
+
+    @override
+    async def get(self) -> UUID:
+        return await self._queue.get()
+
+    @override
+    async def put(self, item: UUID) -> None:
+        self.items.append(item)
+        await self._queue.put(item)
+
+
+class EchoOperation(Operation):
+    """Returns the value parameter."""
+
+    @override
+    async def run(
+        self,
+        parameters: dict[str, types.JSON],
+        dependencies: dict[str, types.JSON],
+    ) -> types.JSON:
+        return parameters.get("value")
+
+
+class EchoOperationFactory(OperationFactory):
+    """Factory for the echo operation."""
+
+    @override
+    async def create(self, operation_type: str) -> Operation | None:
+        return EchoOperation() if operation_type == "echo" else None
+
+
+class DelayCondition(Condition):
+    """Waits for the number of seconds given in the delay parameter."""
+
+    @override
+    async def wait(self, parameters: dict[str, types.JSON]) -> None:
+        delay = parameters.get("delay", 0)
+
+        if isinstance(delay, int | float):
+            await asyncio.sleep(delay)
+
+
+class DelayConditionFactory(ConditionFactory):
+    """Factory for the delay condition."""
+
+    @override
+    async def create(self, condition_type: str) -> Condition | None:
+        return DelayCondition() if condition_type == "delay" else None
+
+
+class AllCleaningStrategy(CleaningStrategy):
+    """Cleans all finished tasks."""
+
+    @override
+    async def evaluate(
+        self, task: t.FinishedTask, parameters: dict[str, types.JSON]
+    ) -> bool:
+        return True
+
+
+class AllCleaningStrategyFactory(CleaningStrategyFactory):
+    """Factory for the all cleaning strategy."""
+
+    @override
+    async def create(self, strategy_type: str) -> CleaningStrategy | None:
+        return AllCleaningStrategy() if strategy_type == "all" else None
@@ -0,0 +1,129 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from pyscheduler.models import transfer as t
+from pyscheduler.models import types
+from pyscheduler.models.data import storage as s
+from pyscheduler.modifier import Modifier
+from pyscheduler.states import StateCache
+from tests.memory import MemoryStore
+
+_TIME = "2024-01-01T00:00:00Z"
+
+
+def _task(dependencies: dict[str, UUID]) -> s.Task:
+    return {
+        "operation": {"type": "echo", "parameters": {}},
+        "condition": {"type": "delay", "parameters": {}},
+        "dependencies": {
+            parameter: str(dependency) for parameter, dependency in dependencies.items()
+        },
+    }
+
+
+def _add(
+    state: s.State, task_id: UUID, status: types.Status, dependencies: list[UUID]
+) -> None:
+    key = str(task_id)
+    task = _task(
+        {str(index): dependency for index, dependency in enumerate(dependencies)}
+    )
+    tasks = state["tasks"]
+
+    match status:
+        case "pending":
+            tasks["pending"][key] = {"task": task, "scheduled": _TIME}
+        case "running":
+            tasks["running"][key] = {"task": task, "scheduled": _TIME, "started": _TIME}
+        case "cancelled":
+            tasks["cancelled"][key] = {
+                "task": task,
+                "scheduled": _TIME,
+                "started": None,
+                "cancelled": _TIME,
+            }
+        case "failed":
+            tasks["failed"][key] = {
+                "task": task,
+                "scheduled": _TIME,
+                "started": _TIME,
+                "failed": _TIME,
+                "error": "error",
+            }
+        case "completed":
+            tasks["completed"][key] = {
+                "task": task,
+                "scheduled": _TIME,
+                "started": _TIME,
+                "completed": _TIME,
+                "result": None,
+            }
+
+    state["statuses"][key] = status
+
+    if dependencies:
+        relationships = state["relationships"]
+        relationships["dependencies"][key] = [str(dep) for dep in dependencies]
+
+        for dependency in dependencies:
+            dependents = relationships["dependents"].setdefault(str(dependency), [])
+            dependents.append(key)
+
+
+def _relations(relations: dict[str, list[str]]) -> dict[str, set[str]]:
+    return {key: set(values) for key, values in relations.items()}
+
+
+@pytest.mark.asyncio
+async def test_remove_stale_tasks_keeps_rejected_tasks_and_their_dependencies(
+    store: MemoryStore,
+) -> None:
+    """Only accepted tasks whose dependents are all removed are removed."""
+    # Chain a <- b <- c <- d, where c is rejected by the predicate,
+    # e depends on a, g stands alone and f has a pending dependent p
+    a, b, c, d, e, f, g, p = (uuid4() for _ in range(8))
+    state = store.value
+    _add(state, a, "completed", [])
+    _add(state, b, "failed", [a])
+    _add(state, c, "completed", [b])
+    _add(state, d, "cancelled", [c])
+    _add(state, e, "completed", [a])
+    _add(state, f, "completed", [])
+    _add(state, g, "failed", [])
+    _add(state, p, "pending", [f])
+
+    checked = list[UUID]()
+
+    async def predicate(task: t.FinishedTask) -> bool:
+        checked.append(task.task.id)
+        return task.task.id != c
+
+    removed = await Modifier(store, StateCache()).remove_stale_tasks(predicate)
+
+    assert removed == {d, e, g}
+    assert sorted(checked) == sorted([c, d, e, g])
+    assert checked.index(d) < checked.index(c)
+
+    kept = {str(task_id) for task_id in (a, b, c, f, p)}
+    state = store.value
+    assert set(state["statuses"]) == kept
+    tasks = state["tasks"]
+    buckets = (
+        tasks["pending"],
+        tasks["running"],
+        tasks["cancelled"],
+        tasks["failed"],
+        tasks["completed"],
+    )
+    assert {key for bucket in buckets for key in bucket} == kept
+    assert _relations(state["relationships"]["dependencies"]) == {
+        str(b): {str(a)},
+        str(c): {str(b)},
+        str(p): {str(f)},
+    }
+    assert _relations(state["relationships"]["dependents"]) == {
+        str(a): {str(b)},
+        str(b): {str(c)},
+        str(f): {str(p)},
+    }
@@ -0,0 +1,150 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from pyscheduler.errors import DependencyNotFoundError, TaskStatusError
+from pyscheduler.models import enums as e
+from pyscheduler.models import transfer as t
+from pyscheduler.scheduler import Scheduler
+from tests.memory import MemoryQueue, MemoryStore
+
+
+def _request(
+    delay: float = 0, value: int = 0, dependencies: dict[str, UUID] | None = None
+) -> t.ScheduleRequest:
+    return t.ScheduleRequest(
+        operation=t.Specification(type="echo", parameters={"value": value}),
+        condition=t.Specification(type="delay", parameters={"delay": delay}),
+        dependencies=dependencies or {},
+    )
+
+
+async def _wait_for_status(
+    scheduler: Scheduler, task_id: UUID, status: e.Status
+) -> None:
+    async with asyncio.timeout(5):
+        while True:
+            task = await scheduler.tasks.get(task_id)
+
+            if task is not None and task.status == status:
+                return
+
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_cancel_many_cancels_all_tasks(scheduler: Scheduler) -> None:
+    """All requested tasks are cancelled and returned in request order."""
+    tasks = [await scheduler.schedule(_request(delay=60)) for _ in range(3)]
+    task_ids = [task.task.id for task in tasks]
+
+    cancelled = await scheduler.cancel_many(
+        [t.CancelRequest(id=task_id) for task_id in task_ids]
+    )
+
+    assert [task.task.id for task in cancelled] == task_ids
+    assert (await scheduler.tasks.list()).cancelled == set(task_ids)
+
+
+@pytest.mark.asyncio
+async def test_cancel_many_cancels_nothing_on_failure(
+    scheduler: Scheduler, store: MemoryStore
+) -> None:
+    """No task is cancelled if any of them cannot be, including duplicates."""
+    pending = await scheduler.schedule(_request(delay=60))
+    completed = await scheduler.schedule(_request())
+    await _wait_for_status(scheduler, completed.task.id, e.Status.COMPLETED)
+    writes = store.writes
+
+    for task_ids in (
+        [pending.task.id, completed.task.id],
+        [pending.task.id, pending.task.id],
+    ):
+        with pytest.raises(TaskStatusError):
+            await scheduler.cancel_many(
+                [t.CancelRequest(id=task_id) for task_id in task_ids]
+            )
+
+    assert store.writes == writes
+    task = await scheduler.tasks.get(pending.task.id)
+    assert task is not None
+    assert task.status == e.Status.PENDING
+
+
+@pytest.mark.asyncio
+async def test_cancel_many_skips_empty_batch(
+    scheduler: Scheduler, store: MemoryStore
+) -> None:
+    """An empty batch does not write the state."""
+    await scheduler.schedule(_request(delay=60))
+    writes = store.writes
+
+    assert await scheduler.cancel_many([]) == []
+    assert store.writes == writes
+
+
+@pytest.mark.asyncio
+async def test_schedule_many_queues_all_tasks(
+    scheduler: Scheduler, queue: MemoryQueue
+) -> None:
+    """All requested tasks are added as pending and queued in request order."""
+    dependency = await scheduler.schedule(_request(delay=60))
+    requests = [
+        _request(delay=60),
+        _request(delay=60, dependencies={"x": dependency.task.id}),
+    ]
+
+    tasks = await scheduler.schedule_many(requests)
+    task_ids = [task.task.id for task in tasks]
+
+    assert len(set(task_ids)) == len(requests)
+    assert tasks[1].task.dependencies == {"x": dependency.task.id}
+    assert queue.items == [dependency.task.id, *task_ids]
+    assert (await scheduler.tasks.list()).pending == {dependency.task.id, *task_ids}
+
+
+@pytest.mark.asyncio
+async def test_schedule_many_adds_nothing_if_dependency_is_missing(
+    scheduler: Scheduler, store: MemoryStore, queue: MemoryQueue
+) -> None:
+    """No task is added or queued if any of them has a missing dependency."""
+    writes = store.writes
+
+    with pytest.raises(DependencyNotFoundError):
+        await scheduler.schedule_many(
+            [_request(), _request(dependencies={"x": uuid4()})]
+        )
+
+    assert store.writes == writes
+    assert queue.items == []
+    index = await scheduler.tasks.list()
+    assert not (index.pending | index.running | index.completed)
+
+
+@pytest.mark.asyncio
+async def test_schedule_many_skips_empty_batch(
+    scheduler: Scheduler, store: MemoryStore, queue: MemoryQueue
+) -> None:
+    """An empty batch does not write the state or queue anything."""
+    await scheduler.schedule(_request(delay=60))
+    writes = store.writes
+    items = list(queue.items)
+
+    assert await scheduler.schedule_many([]) == []
+    assert store.writes == writes
+    assert queue.items == items
+
+
+@pytest.mark.asyncio
+async def test_schedule_copies_dependencies(scheduler: Scheduler) -> None:
+    """Changing a request after scheduling does not change the stored task."""
+    dependency = await scheduler.schedule(_request(delay=60))
+    request = _request(delay=60, dependencies={"a": dependency.task.id})
+
+    task = await scheduler.schedule(request)
+    request.dependencies["zzz"] = uuid4()
+
+    stored = await scheduler.tasks.pending.get(task.task.id)
+    assert stored is not None
+    assert stored.task.dependencies == {"a": dependency.task.id}